@@ -1,14 +1,20 @@
 """GPX to CSV conversion tool with a simple Tkinter GUI."""
 from __future__ import annotations
 import csv
+import functools
 import json
 import math
 import os
+import re
 import tkinter as tk
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from operator import itemgetter
 from tkinter import filedialog, messagebox, ttk
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
 from xml.etree import ElementTree as ET
 ISO_FORMATS = [
     "%Y-%m-%dT%H:%M:%S%z",
@@ -18,10 +24,22 @@ ISO_FORMATS = [
 ]
 GRADIENT_THRESHOLDS = (3, 5, 7, 10, 13, 17, 20, 25, 30, 40)
 GRADIENT_FIELD_NAMES = tuple(f"gradient_{threshold}_distance_km" for threshold in GRADIENT_THRESHOLDS)
+EARTH_RADIUS_M = 6_371_000
+FALLBACK_TIME = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_fromisoformat = datetime.fromisoformat
+# The strings ISO_FORMATS accepts in their canonical shape; only these take the
+# ``fromisoformat`` fast path, which would otherwise also accept date-only
+# values, a space separator, hour-only offsets and the like.
+_ISO_FAST_PATH = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]{1,6})?(Z|[+-][0-9]{2}:?[0-5][0-9])?"
+)
+ENTRY_DEBOUNCE_MS = 150
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+PATH_COLUMN_ALIASES = (("lat", "latitude"), ("lng", "lon", "longitude"), ("ele", "elevation"))
 CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".gpx_to_csv_tool.json")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrackPoint:
     latitude: float
     longitude: float
@@ -29,16 +47,66 @@ class TrackPoint:
     time: datetime
 
 
-@dataclass
+@dataclass(slots=True)
+class Track:
+    """Track stored as parallel columns (structure of arrays).
+
+    The numeric loops only ever touch one or two coordinates at a time, so
+    keeping each one in a contiguous ``array('d')`` avoids a ``TrackPoint``
+    attribute lookup per value. Iterating yields ``TrackPoint`` views.
+    Columns are treated as read-only once the track is built, which lets
+    statistics reuse segment intermediates across calls.
+    """
+
+    latitudes: array
+    longitudes: array
+    elevations: array
+    times: List[datetime]
+    # Segment intermediates keyed by ``min_seg_m``, filled by compute_statistics_many
+    _segments: Dict[float, _Segments] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_points(cls, points: Iterable[TrackPoint]) -> Track:
+        points = points if isinstance(points, list) else list(points)
+        return cls(
+            array("d", [p.latitude for p in points]),
+            array("d", [p.longitude for p in points]),
+            array("d", [p.elevation for p in points]),
+            [p.time for p in points],
+        )
+
+    def __len__(self) -> int:
+        return len(self.elevations)
+
+    def __iter__(self) -> Iterator[TrackPoint]:
+        return map(TrackPoint, self.latitudes, self.longitudes, self.elevations, self.times)
+
+    def reversed(self) -> Track:
+        """Return the track walked backwards, reversing each column without building points."""
+        return Track(self.latitudes[::-1], self.longitudes[::-1], self.elevations[::-1], self.times[::-1])
+
+
+@dataclass(slots=True, frozen=True)
 class SlopeStats:
     distance_km: float
     total_ascent_m: float
     avg_gradient: float
     max_gradient: float
     gradient_distances_km: Dict[int, float]
+@functools.lru_cache(maxsize=8192)
 def parse_iso_datetime(value: str) -> datetime:
-    """Parse an ISO formatted string, supporting a trailing Z."""
+    """Parse an ISO formatted string, supporting a trailing Z.
+
+    Only the ``ISO_FORMATS`` grammar is accepted; ``fromisoformat`` just parses
+    its canonical shape faster.
+    """
     value = value.strip()
+    if _ISO_FAST_PATH.fullmatch(value):
+        try:
+            # C fast path; accepts a trailing Z on Python 3.11+.
+            return _fromisoformat(value)
+        except ValueError:
+            pass
     if value.endswith("Z"):
         value = value[:-1] + "+0000"
     for fmt in ISO_FORMATS:
@@ -47,37 +115,86 @@ def parse_iso_datetime(value: str) -> datetime:
         except ValueError:
             continue
     raise ValueError(f"Unsupported datetime format: {value}")
+def _qualify(namespace: str, local_name: str) -> str:
+    return f"{{{namespace}}}{local_name}" if namespace else local_name
+
+
+def _root_namespace(file_path: str) -> str:
+    """Return the namespace of the document's root element, reading only its start tag."""
+    with open(file_path, "rb") as source:
+        for _, root in ET.iterparse(source, events=("start",)):
+            return root.tag[1:].split("}")[0] if root.tag.startswith("{") else ""
+    return ""
+
+
+def _iter_trkpt_elements(file_path: str, trkpt_tag: str) -> Iterator[ET.Element]:
+    """Stream the ``trkpt_tag`` elements of a GPX file, discarding each one once consumed."""
+    # The TreeBuilder joins character data split across expat read buffers
+    # before an element ends, so ``findtext`` always sees the full
+    # ``ele``/``time`` text; expat's own ``buffer_text`` switch is not exposed
+    # by the C-accelerated XMLParser and is not needed here.
+    for _, elem in ET.iterparse(file_path, events=("end",)):
+        if elem.tag == trkpt_tag:
+            yield elem
+            elem.clear()
+
+
+def file_signature(file_path: str) -> tuple[str, int, int]:
+    """Return ``(absolute path, mtime_ns, size)`` identifying the current contents of a file."""
+    stat = os.stat(file_path)
+    return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+
 def parse_gpx(file_path: str) -> List[TrackPoint]:
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-    namespace = ""
-    if root.tag.startswith("{"):
-        namespace = root.tag.split("}")[0].strip("{")
+    """Return the time-sorted track points of a GPX file.
+
+    Parsed tracks are memoised per file signature, so re-running a conversion
+    on an unchanged file skips the XML parse while edits invalidate the entry.
+    """
+    return list(_parse_gpx_cached(*file_signature(file_path)))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_gpx_cached(file_path: str, mtime_ns: int, size: int) -> tuple[TrackPoint, ...]:
+    # ``mtime_ns`` and ``size`` are only part of the cache key.
+    return tuple(_read_gpx(file_path))
+
+
+def _read_gpx(file_path: str) -> List[TrackPoint]:
     points: List[TrackPoint] = []
-    search_expr = f".//{{{namespace}}}trkpt" if namespace else ".//trkpt"
-    fallback_time = datetime(1970, 1, 1, tzinfo=timezone.utc)
-    for point in root.findall(search_expr):
-        lat = float(point.attrib["lat"])
-        lon = float(point.attrib["lon"])
-        ele_elem = point.find(f"{{{namespace}}}ele") if namespace else point.find("ele")
-        time_elem = point.find(f"{{{namespace}}}time") if namespace else point.find("time")
-        if ele_elem is None:
+    # Bind hot names locally so the per-point loop avoids global lookups.
+    append = points.append
+    to_float = float
+    parse_time = parse_iso_datetime
+    make_point = TrackPoint
+    one_second = timedelta(seconds=1)
+    prev_time: Optional[datetime] = None
+    # Only track points in the root's namespace count, so ``trkpt`` elements of
+    # other namespaces (e.g. inside ``<extensions>``) are not taken as points.
+    namespace = _root_namespace(file_path)
+    ele_tag = _qualify(namespace, "ele")
+    time_tag = _qualify(namespace, "time")
+    for point in _iter_trkpt_elements(file_path, _qualify(namespace, "trkpt")):
+        ele_text = point.findtext(ele_tag)
+        if ele_text is None:
             continue
-        elevation = float(ele_elem.text)
+        attrib = point.attrib
+        lat = to_float(attrib["lat"])
+        lon = to_float(attrib["lon"])
+        elevation = to_float(ele_text)
+        time_text = point.findtext(time_tag)
         dt: Optional[datetime] = None
-        if time_elem is not None and time_elem.text:
+        if time_text:
             try:
-                dt = parse_iso_datetime(time_elem.text)
+                dt = parse_time(time_text)
             except ValueError:
                 dt = None
         if dt is None:
             # Some GPX files omit timestamps; synthesize sequential times so downstream
             # filtering and slider logic continue to work.
-            if points:
-                dt = points[-1].time + timedelta(seconds=1)
-            else:
-                dt = fallback_time
-        points.append(TrackPoint(lat, lon, elevation, dt))
+            dt = prev_time + one_second if prev_time is not None else FALLBACK_TIME
+        append(make_point(lat, lon, elevation, dt))
+        prev_time = dt
     points.sort(key=lambda p: p.time)
     return points
 
@@ -86,9 +203,11 @@ def datetime_to_timestamp(dt: datetime) -> float:
     if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.timestamp()
+def _point_timestamp(point: TrackPoint) -> float:
+    return datetime_to_timestamp(point.time)
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate the Haversine distance in meters between two points."""
-    radius = 6_371_000  # meters
+    radius = EARTH_RADIUS_M
     phi1 = math.radians(lat1)
     phi2 = math.radians(lat2)
     delta_phi = math.radians(lat2 - lat1)
@@ -97,22 +216,76 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     return radius * c
 def filter_points(points: Iterable[TrackPoint], start: Optional[datetime], end: Optional[datetime]) -> List[TrackPoint]:
-    filtered: List[TrackPoint] = []
-    start_ts = datetime_to_timestamp(start) if start else None
-    end_ts = datetime_to_timestamp(end) if end else None
-    for point in points:
-        ts = datetime_to_timestamp(point.time)
-        if start_ts is not None and ts < start_ts:
+    """Return the points whose time lies within ``[start, end]``.
+
+    ``points`` must be sorted by time (as returned by ``parse_gpx``), which
+    lets both bounds be located with a binary search instead of a full scan.
+    """
+    ordered = points if isinstance(points, list) else list(points)
+    lo = 0
+    hi = len(ordered)
+    if start:
+        lo = bisect_left(ordered, datetime_to_timestamp(start), key=_point_timestamp)
+    if end:
+        hi = bisect_right(ordered, datetime_to_timestamp(end), lo, hi, key=_point_timestamp)
+    return ordered[lo:hi]
+def _build_segments(
+    latitudes: Sequence[float], longitudes: Sequence[float], min_seg_m: float
+) -> tuple[List[int], List[float]]:
+    """Return the end index and horizontal length of every segment along the path.
+
+    A segment closes at the first point at least ``min_seg_m`` away from the
+    previous segment end; the final point always closes the last segment.
+    Only coordinates are involved, so raw and smoothed elevations share the
+    same segments. Latitude cosines are computed once per point instead of
+    once per haversine call; coordinate differences are still taken in
+    degrees before converting, as ``haversine_distance`` does, since
+    subtracting two nearby degree values is exact.
+    """
+    n = len(latitudes)
+    cos_phis = [math.cos(math.radians(lat)) for lat in latitudes]
+    # ``math.radians(d) / 2`` is ``d * (pi / 180) / 2``; halving is exact in
+    # binary floating point, so one multiply by pi / 360 gives the same
+    # half-angle bit for bit.
+    half_radian = math.pi / 360
+    sin, sqrt, atan2 = math.sin, math.sqrt, math.atan2
+    diameter = 2 * EARTH_RADIUS_M
+
+    # The haversine distance grows monotonically with ``a``, so any ``a`` below
+    # that of ``min_seg_m`` (less a rounding margin) cannot close a segment and
+    # skips the sqrt/atan2 evaluation entirely.
+    min_a = sin(min_seg_m / diameter) ** 2 * (1 - 1e-9) if min_seg_m > 0 else 0.0
+    last = n - 1
+
+    ends: List[int] = []
+    distances: List[float] = []
+    prev_lat, prev_lon, prev_cos_phi = latitudes[0], longitudes[0], cos_phis[0]
+    for i, lat, lon, cos_phi in zip(range(1, n), latitudes[1:], longitudes[1:], cos_phis[1:]):
+        a = sin((lat - prev_lat) * half_radian) ** 2 + prev_cos_phi * cos_phi * sin((lon - prev_lon) * half_radian) ** 2
+        if a <= 0 or (a < min_a and i != last):
             continue
-        if end_ts is not None and ts > end_ts:
+        horiz_distance = diameter * atan2(sqrt(a), sqrt(1 - a))
+        if horiz_distance <= 0:
             continue
-        filtered.append(point)
-    return filtered
-def _smooth_elevations(points: List[TrackPoint], window: int) -> List[TrackPoint]:
-    """Return a new list with smoothed elevations using a centered moving average."""
-    n = len(points)
+        if horiz_distance >= min_seg_m or i == last:
+            ends.append(i)
+            distances.append(horiz_distance)
+            prev_lat, prev_lon, prev_cos_phi = lat, lon, cos_phi
+    return ends, distances
+
+
+def _smoothed_elevations_at(
+    elevations: Sequence[float], indices: List[int], window: int, prefix: Optional[List[float]] = None
+) -> List[float]:
+    """Return the centered moving-average elevation at each of the ascending ``indices``.
+
+    The statistics only need smoothed values at segment ends, so each one is
+    taken as a difference of two prefix sums instead of smoothing the whole
+    track. ``prefix`` may pass in precomputed prefix sums of ``elevations``.
+    """
+    n = len(elevations)
     if window is None or window <= 1 or n == 0:
-        return [TrackPoint(p.latitude, p.longitude, p.elevation, p.time) for p in points]
+        return [elevations[i] for i in indices]
 
     window = min(window, n)
     # Keep the current point centered in the window. For even windows, favor the sample ahead
@@ -121,47 +294,78 @@ def _smooth_elevations(points: List[TrackPoint], window: int) -> List[TrackPoint
     # shifting the window to always include the requested number of points.
     left = window // 2
     right = window - left - 1
+    if prefix is None:
+        prefix = list(accumulate(elevations, initial=0.0))
+
+    # Only indices near either end of the track see a window clipped short.
+    body_start = bisect_left(indices, left)
+    body_end = bisect_right(indices, n - right - 1)
+    head = [prefix[i + right + 1] / (i + right + 1) for i in indices[:body_start]]
+    body = [(prefix[i + right + 1] - prefix[i - left]) / window for i in indices[body_start:body_end]]
+    tail = [(prefix[n] - prefix[i - left]) / (n - i + left) for i in indices[body_end:]]
+    return head + body + tail
+
+
+def _climb_totals(horizontal_distances: List[float], profile: List[float]) -> tuple[float, float, float]:
+    """Return horizontal distance, slope distance and total climb in a single pass over the segments.
+
+    ``profile`` holds the elevation at the path start followed by the
+    elevation at each segment end.
+    """
+    horizontal_sum = 0.0
+    slope_distance = 0.0
+    climb = 0.0
+    hypot = math.hypot
+    for horiz_distance, prev_ele, ele in zip(horizontal_distances, profile, profile[1:]):
+        elevation_change = ele - prev_ele
+        if elevation_change > 0:
+            climb += elevation_change
+        horizontal_sum += horiz_distance
+        slope_distance += hypot(horiz_distance, elevation_change)
+    return horizontal_sum, slope_distance, climb
+
+
+def _cumulative_segments(filtered_segments: List[tuple[float, float]]) -> tuple[List[float], List[float]]:
+    """Return running horizontal distance and elevation totals, both starting at zero."""
+    cumulative_distance = list(accumulate((horiz for horiz, _ in filtered_segments), initial=0.0))
+    cumulative_elevation = list(accumulate((change for _, change in filtered_segments), initial=0.0))
+    return cumulative_distance, cumulative_elevation
+
 
-    prefix: List[float] = [0.0]
-    for pt in points:
-        prefix.append(prefix[-1] + pt.elevation)
-
-    smoothed: List[TrackPoint] = []
-    for i in range(n):
-        start = max(0, i - left)
-        end = min(n, i + right + 1)
-        if end <= start:
-            start = i
-            end = i + 1
-        total = prefix[end] - prefix[start]
-        count = end - start
-        ele = total / count if count else points[i].elevation
-        smoothed.append(TrackPoint(points[i].latitude, points[i].longitude, ele, points[i].time))
-    return smoothed
 def _iter_window_gradients(
     filtered_segments: List[tuple[float, float]], window_size: int
 ) -> List[tuple[float, float]]:
     """Yield gradient and horizontal distance per rolling window sized by ``window_size``."""
     if not filtered_segments:
         return []
+    return _window_gradients(*_cumulative_segments(filtered_segments), window_size)
 
-    safe_window = max(1, window_size)
-    cumulative_distance = [0.0]
-    cumulative_elevation = [0.0]
 
-    for horiz_distance, elevation_change in filtered_segments:
-        cumulative_distance.append(cumulative_distance[-1] + horiz_distance)
-        cumulative_elevation.append(cumulative_elevation[-1] + elevation_change)
+def _window_gradients(
+    cumulative_distance: List[float], cumulative_elevation: List[float], window_size: int
+) -> List[tuple[float, float]]:
+    """Return gradient and horizontal distance per window from precomputed running totals.
+
+    The running totals do not depend on ``window_size``, so a window sweep
+    builds them once and only re-strides them here.
+    """
+    if len(cumulative_distance) < 2:
+        return []
 
+    safe_window = max(1, window_size)
+    # Window boundaries sit every ``safe_window`` entries; striding the running
+    # totals pairs each boundary with the previous one without index arithmetic.
+    distance_marks = cumulative_distance[::safe_window]
+    elevation_marks = cumulative_elevation[::safe_window]
     gradients: List[tuple[float, float]] = []
-    for i in range(safe_window, len(cumulative_distance),safe_window):
-        start_idx = max(0, i - safe_window)
-        horiz_delta = cumulative_distance[i] - cumulative_distance[start_idx]
+    append = gradients.append
+    for start_dist, end_dist, start_ele, end_ele in zip(
+        distance_marks, distance_marks[1:], elevation_marks, elevation_marks[1:]
+    ):
+        horiz_delta = end_dist - start_dist
         if horiz_delta <= 0:
             continue
-        elev_delta = cumulative_elevation[i] - cumulative_elevation[start_idx]
-        grade = (elev_delta / horiz_delta) * 100
-        gradients.append((grade, horiz_delta))
+        append(((end_ele - start_ele) / horiz_delta * 100, horiz_delta))
     if len(gradients)==0:
         start_idx = 0
         horiz_delta = cumulative_distance[-1] - cumulative_distance[start_idx]
@@ -186,77 +390,109 @@ def _calculate_max_gradient(filtered_segments: List[tuple[float, float]], window
 
     return max(grade for grade, _ in window_gradients)
 
-def compute_statistics(points: List[TrackPoint], smoothing_points: int = 1, min_seg_m: float = 1.0) -> SlopeStats:
-    """Compute distance, climbing stats, and gradient distribution."""
-    if len(points) < 2:
-        return SlopeStats(0.0, 0.0, 0.0, 0.0, {threshold: 0.0 for threshold in GRADIENT_THRESHOLDS})
-
-    use_window = max(1, smoothing_points if smoothing_points is not None else 1)
-    # Apply elevation smoothing for the aggregated calculations while keeping
-    # the original lat/lng coordinates intact. Using the same ``use_window`` for
-    # both smoothing and the rolling gradient aggregation keeps the smoothing
-    # slider meaningful without allowing larger windows to inflate the maximum
-    # gradient.
-    pts = _smooth_elevations(points, use_window)
-
-    def _build_segments(path_points: List[TrackPoint]) -> List[tuple[float, float]]:
-        segments: List[tuple[float, float]] = []
-        prev_pt = path_points[0]
-        for mid in path_points[1:-1]:
-            horiz_distance = haversine_distance(prev_pt.latitude, prev_pt.longitude, mid.latitude, mid.longitude)
-            elevation_change = mid.elevation - prev_pt.elevation
-
-            if horiz_distance <= 0:
-                continue
+def _gradient_distances(window_gradients: List[tuple[float, float]]) -> Dict[int, float]:
+    """Return the horizontal distance (m) at or above each gradient threshold.
 
-            if horiz_distance >= min_seg_m:
-                segments.append((horiz_distance, elevation_change))
-                prev_pt = mid
-
-        last = path_points[-1]
-        horiz_distance = haversine_distance(prev_pt.latitude, prev_pt.longitude, last.latitude, last.longitude)
-        elevation_change = last.elevation - prev_pt.elevation
-        if horiz_distance > 0:
-            segments.append((horiz_distance, elevation_change))
+    A single ``bisect_right`` finds how many thresholds each window reaches,
+    so only those totals are touched instead of testing all of them. Every
+    total still adds its windows in path order, matching a per-threshold sum.
+    """
+    thresholds = GRADIENT_THRESHOLDS
+    totals = [0.0] * len(thresholds)
+    for grade, horiz_delta in window_gradients:
+        if grade > 0:
+            for k in range(bisect_right(thresholds, grade)):
+                totals[k] += horiz_delta
+    return dict(zip(thresholds, totals))
 
-        return segments
 
-    filtered_segments = _build_segments(pts)
-    raw_segments = _build_segments(points)
+@dataclass(slots=True)
+class _Segments:
+    """Window-independent intermediates shared by every smoothing window of a track."""
 
-    total_distance = 0.0
-    horizontal_distance_sum = 0.0
-    total_climb = 0.0
-    gradient_distances = {threshold: 0.0 for threshold in GRADIENT_THRESHOLDS}
+    elevations: Sequence[float]
+    # Index of the path start followed by the index of every segment end
+    profile_indices: List[int]
+    # Unsmoothed elevation at each of ``profile_indices``, reused for windows below 2
+    raw_profile: List[float]
+    horizontal_distances: List[float]
+    cumulative_distance: List[float]
+    cumulative_elevation: List[float]
+    prefix: Optional[List[float]] = None
 
-    for horiz_distance, elevation_change in filtered_segments:
-        grade = (elevation_change / horiz_distance) * 100
+    @classmethod
+    def from_track(cls, track: Track, min_seg_m: float) -> _Segments:
+        ends, horizontal_distances = _build_segments(track.latitudes, track.longitudes, min_seg_m)
+        elevations = track.elevations
+        profile_indices = [0] + ends
+        raw_profile = [elevations[i] for i in profile_indices]
+        raw_changes = [
+            (horiz, ele - prev_ele) for horiz, prev_ele, ele in zip(horizontal_distances, raw_profile, raw_profile[1:])
+        ]
+        return cls(
+            elevations, profile_indices, raw_profile, horizontal_distances, *_cumulative_segments(raw_changes)
+        )
 
-        if elevation_change > 0:
-            total_climb += elevation_change
+    def elevation_prefix(self) -> List[float]:
+        """Return elevation prefix sums, computed on first use."""
+        if self.prefix is None:
+            self.prefix = list(accumulate(self.elevations, initial=0.0))
+        return self.prefix
 
-        horizontal_distance_sum += horiz_distance
-        total_distance += math.sqrt(horiz_distance ** 2 + elevation_change ** 2)
 
-    window_gradients = _iter_window_gradients(raw_segments, use_window)
-    max_grade = 0.0
-    for grade, horiz_delta in window_gradients:
-        max_grade = max(max_grade, grade)
-        if grade > 0:
-            for threshold in GRADIENT_THRESHOLDS:
-                if grade >= threshold:
-                    gradient_distances[threshold] += horiz_delta
+def _window_statistics(segments: _Segments, use_window: int) -> SlopeStats:
+    # Apply elevation smoothing for the aggregated calculations while keeping
+    # the original lat/lng coordinates intact. Using the same ``use_window`` for
+    # both smoothing and the rolling gradient aggregation keeps the smoothing
+    # slider meaningful without allowing larger windows to inflate the maximum
+    # gradient.
+    if use_window < 2:
+        # Smoothing is off; the raw profile already holds the segment-end elevations
+        profile = segments.raw_profile
+    else:
+        profile = _smoothed_elevations_at(
+            segments.elevations, segments.profile_indices, use_window, segments.elevation_prefix()
+        )
+    horizontal_distance_sum, total_distance, total_climb = _climb_totals(segments.horizontal_distances, profile)
 
-    raw_window_gradients = _iter_window_gradients(raw_segments, use_window)
-    if raw_window_gradients:
-        raw_cap = max(grade for grade, _ in raw_window_gradients)
-        max_grade = min(max_grade, raw_cap)
+    window_gradients = _window_gradients(segments.cumulative_distance, segments.cumulative_elevation, use_window)
+    max_grade = max(grade for grade, _ in window_gradients) if window_gradients else 0.0
+    gradient_distances = _gradient_distances(window_gradients)
 
     horizontal_for_grade = horizontal_distance_sum if horizontal_distance_sum > 0 else total_distance
     avg_grade = (total_climb / horizontal_for_grade * 100) if horizontal_for_grade > 0 else 0.0
     distance_output = horizontal_distance_sum if horizontal_distance_sum > 0 else total_distance
     gradient_km = {threshold: value / 1000 for threshold, value in gradient_distances.items()}
     return SlopeStats(distance_output / 1000, total_climb, avg_grade, max_grade, gradient_km)
+
+
+def compute_statistics(
+    points: Union[List[TrackPoint], Track], smoothing_points: int = 1, min_seg_m: float = 1.0
+) -> SlopeStats:
+    """Compute distance, climbing stats, and gradient distribution."""
+    return compute_statistics_many(points, [smoothing_points], min_seg_m)[0]
+
+
+def compute_statistics_many(
+    points: Union[List[TrackPoint], Track], smoothing_points_list: Iterable[int], min_seg_m: float = 1.0
+) -> List[SlopeStats]:
+    """Compute statistics for several smoothing windows over the same points.
+
+    Segments, running distance/elevation totals and elevation prefix sums do
+    not depend on the window, so they are built once and shared by every
+    window; each window only re-strides them.
+    """
+    windows = [max(1, window if window is not None else 1) for window in smoothing_points_list]
+    if len(points) < 2:
+        return [
+            SlopeStats(0.0, 0.0, 0.0, 0.0, {threshold: 0.0 for threshold in GRADIENT_THRESHOLDS}) for _ in windows
+        ]
+
+    track = points if isinstance(points, Track) else Track.from_points(points)
+    segments = track._segments.get(min_seg_m)
+    if segments is None:
+        segments = track._segments[min_seg_m] = _Segments.from_track(track, min_seg_m)
+    return [_window_statistics(segments, window) for window in windows]
 def write_slopes_csv(output_dir: str, stats: SlopeStats) -> str:
     os.makedirs(output_dir, exist_ok=True)
     file_path = os.path.join(output_dir, "slopes.csv")
@@ -312,38 +548,104 @@ def write_paths_csv(output_dir: str, points: List[TrackPoint]) -> str:
     os.makedirs(output_dir, exist_ok=True)
     file_path = os.path.join(output_dir, "paths.csv")
     headers = ["lat", "lng", "ele"]
-    with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
+    with open(file_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(headers)
-        for point in points:
-            writer.writerow([f"{point.latitude:.6f}", f"{point.longitude:.6f}", f"{point.elevation:.2f}"])
+        writer.writerows(
+            (f"{point.latitude:.6f}", f"{point.longitude:.6f}", f"{point.elevation:.2f}") for point in points
+        )
     return file_path
 
 
-def read_paths_csv(file_path: str) -> List[TrackPoint]:
-    """Load TrackPoint instances from a previously exported paths.csv file."""
-    points: List[TrackPoint] = []
-    with open(file_path, "r", newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        if reader.fieldnames is None:
-            raise ValueError("Missing header row in paths.csv")
-        base_time = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        for idx, row in enumerate(reader):
+def _path_columns(header: List[str]) -> List[List[Optional[int]]]:
+    """Return the header position of every alias in ``PATH_COLUMN_ALIASES``, or None when absent.
+
+    Like ``csv.DictReader``, the last of several columns sharing a name wins.
+    """
+    positions = {name: idx for idx, name in enumerate(header)}
+    return [[positions.get(name) for name in aliases] for aliases in PATH_COLUMN_ALIASES]
+
+
+def _convert_path_columns(
+    rows: List[List[str]], columns: List[List[Optional[int]]]
+) -> Optional[tuple[array, array, array]]:
+    """Convert whole lat/lng/ele columns at once, or return None if any row needs a closer look.
+
+    This only succeeds when every row holds a number in the first alias column
+    present in the header, which is what every exported paths.csv looks like.
+    """
+    leading = [[col for col in aliases if col is not None][:1] for aliases in columns]
+    if not rows or not all(leading):
+        return None
+    values = itemgetter(*(present[0] for present in leading))
+    try:
+        latitudes, longitudes, elevations = (array("d", map(float, column)) for column in zip(*map(values, rows)))
+    except (IndexError, ValueError):
+        return None
+    return latitudes, longitudes, elevations
+
+
+def _read_path_rows(rows: List[List[str]], columns: List[List[Optional[int]]]) -> tuple[array, array, array]:
+    """Convert paths.csv rows one at a time, reporting the first row that cannot be loaded.
+
+    Each value comes from the first non-empty alias column, so an empty ``lat``
+    still falls back to ``latitude``. All three values are converted before
+    missing ones are reported, so an unparseable value wins over an empty one.
+    """
+    latitudes, longitudes, elevations = array("d"), array("d"), array("d")
+    for idx, row in enumerate(rows):
+        values: List[Optional[float]] = []
+        for aliases in columns:
+            text: Optional[str] = None
+            for col in aliases:
+                text = row[col] if col is not None and col < len(row) else None
+                if text:
+                    break
             try:
-                lat_val = row.get("lat") or row.get("latitude")
-                lng_val = row.get("lng") or row.get("lon") or row.get("longitude")
-                ele_val = row.get("ele") or row.get("elevation")
-                lat = float(lat_val) if lat_val is not None else None
-                lng = float(lng_val) if lng_val is not None else None
-                ele = float(ele_val) if ele_val is not None else None
+                values.append(float(text) if text is not None else None)
             except ValueError as exc:
                 raise ValueError(f"Invalid numeric value on row {idx + 2}: {exc}") from exc
-            if lat is None or lng is None or ele is None:
-                raise ValueError(f"Missing lat/lng/ele values on row {idx + 2}")
-            points.append(TrackPoint(lat, lng, ele, base_time + timedelta(seconds=idx)))
-    if not points:
+        lat, lng, ele = values
+        if lat is None or lng is None or ele is None:
+            raise ValueError(f"Missing lat/lng/ele values on row {idx + 2}")
+        latitudes.append(lat)
+        longitudes.append(lng)
+        elevations.append(ele)
+    return latitudes, longitudes, elevations
+
+
+def read_paths_track(file_path: str) -> Track:
+    """Load a previously exported paths.csv file directly into track columns.
+
+    Tracks are memoised per file signature like ``parse_gpx``, so recalculating
+    the same file also reuses the segments cached on the returned track; treat
+    it as read-only.
+    """
+    return _read_paths_track_cached(*file_signature(file_path))
+
+
+@functools.lru_cache(maxsize=4)
+def _read_paths_track_cached(file_path: str, mtime_ns: int, size: int) -> Track:
+    # ``mtime_ns`` and ``size`` are only part of the cache key.
+    with open(file_path, "r", newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("Missing header row in paths.csv")
+        # Resolve the columns once instead of looking up every alias on every row
+        columns = _path_columns(header)
+        rows = list(filter(None, reader))  # skip blank lines like csv.DictReader
+    latitudes, longitudes, elevations = _convert_path_columns(rows, columns) or _read_path_rows(rows, columns)
+    if not elevations:
         raise ValueError("No path points found in the selected CSV file")
-    return points
+    # paths.csv carries no timestamps; synthesize one per second like parse_gpx does
+    times = [FALLBACK_TIME + timedelta(seconds=idx) for idx in range(len(elevations))]
+    return Track(latitudes, longitudes, elevations, times)
+
+
+def read_paths_csv(file_path: str) -> List[TrackPoint]:
+    """Load TrackPoint instances from a previously exported paths.csv file."""
+    return list(read_paths_track(file_path))
 class GPXConverterGUI:
     def __init__(self) -> None:
         self.root = tk.Tk()
@@ -362,8 +664,15 @@ class GPXConverterGUI:
         self.reverse_points_var = tk.BooleanVar(value=False)
         # Holds GPX points once a file is chosen
         self.points: List[TrackPoint] = []
+        # Signature of the file ``self.points`` was parsed from, so convert can reuse them
+        self._points_source: Optional[tuple[str, int, int]] = None
         # Internal guard to avoid feedback loops when syncing widget values
         self._syncing = False
+        # POSIX timestamps of ``self.points``, used to binary-search slider positions
+        self._timestamps = array("d")
+        # Pending ``after`` jobs that apply typed start/end times once typing pauses
+        self._start_entry_job: Optional[str] = None
+        self._end_entry_job: Optional[str] = None
         local_tz = datetime.now().astimezone().tzinfo
         self._local_tz = local_tz if local_tz is not None else timezone.utc
         self._config = self._load_config()
@@ -479,8 +788,7 @@ class GPXConverterGUI:
         if not self.points or dt is None:
             return "Offset: --:--"
         try:
-            base_dt = self.points[0].time
-            delta = abs(self._to_timestamp(dt) - self._to_timestamp(base_dt))
+            delta = abs(self._to_timestamp(dt) - self._timestamps[0])
         except (IndexError, ValueError):
             return "Offset: --:--"
         minutes = int(delta // 60)
@@ -529,21 +837,29 @@ class GPXConverterGUI:
         return max(0, points)
 
     def _find_nearest_index(self, dt: datetime) -> int:
-        if not self.points:
+        if not self._timestamps:
             return 0
         target = self._to_timestamp(dt)
-        # Linear search is ok for typical GPX sizes; keeps dependencies minimal
-        best_i = 0
-        best_delta = float("inf")
-        for i, p in enumerate(self.points):
-            ts = self._to_timestamp(p.time)
-            d = abs(ts - target)
-            if d < best_delta:
-                best_delta = d
-                best_i = i
-        return best_i
+        timestamps = self._timestamps
+        # Points are time-sorted, so the nearest one is adjacent to the insertion point
+        i = bisect_left(timestamps, target)
+        if i == len(timestamps) or (i > 0 and target - timestamps[i - 1] <= timestamps[i] - target):
+            # Prefer the earliest of several points sharing the same timestamp
+            i = bisect_left(timestamps, timestamps[i - 1], 0, i - 1)
+        return i
+    def _cancel_entry_jobs(self, start: bool = True, end: bool = True) -> None:
+        """Drop pending typed-time updates superseded by a slider move or a new track."""
+        if start and self._start_entry_job is not None:
+            self.root.after_cancel(self._start_entry_job)
+            self._start_entry_job = None
+        if end and self._end_entry_job is not None:
+            self.root.after_cancel(self._end_entry_job)
+            self._end_entry_job = None
     def _apply_points_to_sliders(self) -> None:
         """Configure and enable sliders based on currently loaded points."""
+        self._cancel_entry_jobs()
+        # Computed once per load; parse_gpx sorts by time so the array is monotonic
+        self._timestamps = array("d", map(_point_timestamp, self.points))
         if not self.points:
             # disable
             self.start_scale.configure(state="disabled", from_=0.0, to=0.0)
@@ -571,6 +887,7 @@ class GPXConverterGUI:
     def _on_start_scale_move(self, value: str) -> None:
         if self._syncing or not self.points:
             return
+        self._cancel_entry_jobs(end=False)
         idx = max(0, min(int(round(float(value))), len(self.points) - 1))
         # Keep start <= end
         if idx > int(round(self.end_index_var.get())):
@@ -591,6 +908,7 @@ class GPXConverterGUI:
     def _on_end_scale_move(self, value: str) -> None:
         if self._syncing or not self.points:
             return
+        self._cancel_entry_jobs(start=False)
         idx = max(0, min(int(round(float(value))), len(self.points) - 1))
         # Keep start <= end
         if idx < int(round(self.start_index_var.get())):
@@ -611,6 +929,14 @@ class GPXConverterGUI:
     def _on_start_entry_changed(self, *_: object) -> None:
         if self._syncing or not self.points:
             return
+        # Typing fires a trace per keystroke; only apply the value once typing pauses
+        if self._start_entry_job is not None:
+            self.root.after_cancel(self._start_entry_job)
+        self._start_entry_job = self.root.after(ENTRY_DEBOUNCE_MS, self._apply_start_entry)
+    def _apply_start_entry(self) -> None:
+        self._start_entry_job = None
+        if not self.points:
+            return
         txt = self.start_time_var.get().strip()
         if not txt:
             return
@@ -630,6 +956,14 @@ class GPXConverterGUI:
     def _on_end_entry_changed(self, *_: object) -> None:
         if self._syncing or not self.points:
             return
+        # Typing fires a trace per keystroke; only apply the value once typing pauses
+        if self._end_entry_job is not None:
+            self.root.after_cancel(self._end_entry_job)
+        self._end_entry_job = self.root.after(ENTRY_DEBOUNCE_MS, self._apply_end_entry)
+    def _apply_end_entry(self) -> None:
+        self._end_entry_job = None
+        if not self.points:
+            return
         txt = self.end_time_var.get().strip()
         if not txt:
             return
@@ -658,13 +992,16 @@ class GPXConverterGUI:
                 self.output_dir_var.set(os.path.dirname(os.path.abspath(file_path)))
             # Parse immediately to configure sliders
             try:
+                source = file_signature(file_path)
                 pts = parse_gpx(file_path)
             except Exception as exc:  # pylint: disable=broad-except
                 messagebox.showerror("Error", f"Failed to parse GPX file: {exc}")
                 self.points = []
+                self._points_source = None
                 self._apply_points_to_sliders()
                 return
             self.points = pts
+            self._points_source = source
             if not self.points:
                 messagebox.showerror("Error", "No valid track points found in the GPX file.")
             self._apply_points_to_sliders()
@@ -678,7 +1015,11 @@ class GPXConverterGUI:
             messagebox.showerror("Error", "Please select a GPX file.")
             return
         try:
-            points = parse_gpx(gpx_path)
+            # Reuse the points parsed by select_file unless the path or file changed since
+            if self.points and self._points_source == file_signature(gpx_path):
+                points = self.points
+            else:
+                points = parse_gpx(gpx_path)
         except Exception as exc:  # pylint: disable=broad-except
             messagebox.showerror("Error", f"Failed to parse GPX file: {exc}")
             return
@@ -728,12 +1069,12 @@ class GPXConverterGUI:
         if not file_path:
             return
         try:
-            points = read_paths_csv(file_path)
+            points = read_paths_track(file_path)
         except Exception as exc:  # pylint: disable=broad-except
             messagebox.showerror("Error", f"Failed to read paths CSV: {exc}")
             return
         if self.reverse_points_var.get():
-            points = list(reversed(points))
+            points = points.reversed()
         smoothing_points = self._get_smoothing_points()
         stats = compute_statistics(points, smoothing_points=smoothing_points, min_seg_m=2.0)
         output_dir = self.output_dir_var.get().strip() or os.path.dirname(os.path.abspath(file_path))
@@ -767,9 +1108,9 @@ class GPXConverterGUI:
         for file_name in csv_files:
             file_path = os.path.join(folder, file_name)
             try:
-                points = read_paths_csv(file_path)
+                points = read_paths_track(file_path)
                 if self.reverse_points_var.get():
-                    points = list(reversed(points))
+                    points = points.reversed()
                 stats = compute_statistics(points, smoothing_points=smoothing_points, min_seg_m=2.0)
                 results.append((file_name, stats))
             except Exception as exc:  # pylint: disable=broad-except
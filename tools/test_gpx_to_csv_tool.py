@@ -1,43 +1,69 @@
+import functools
+import math
 import os
+import random
+import tempfile
 import unittest
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
+from typing import List
 
-from tools.gpx_to_csv_tool import TrackPoint, compute_statistics, read_paths_csv
+from tools.gpx_to_csv_tool import (
+    Track,
+    TrackPoint,
+    compute_statistics,
+    compute_statistics_many,
+    parse_gpx,
+    parse_iso_datetime,
+    read_paths_csv,
+)
+
+PATHS_DIR = Path(__file__).resolve().parents[1] / "public" / "data" / "paths"
+
+
+@functools.lru_cache(maxsize=None)
+def _load(file_name: str) -> List[TrackPoint]:
+    return read_paths_csv(os.fspath(PATHS_DIR / file_name))
 
 
 class ComputeStatisticsTests(unittest.TestCase):
-    def test_max_gradient_monotonic_with_smoothing(self) -> None:
-        data_path = Path(__file__).resolve().parents[1] / "public" / "data" / "paths" / "波波.csv"
-        points = read_paths_csv(os.fspath(data_path))
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._points_bobo = _load("波波.csv")
+        cls._points_canto = _load("牛潭尾濾水廠-Out.csv")
 
-        windows = [0, 1, 10, 20, 30]
-        gradients = [
-            compute_statistics(points, smoothing_points=window, min_seg_m=2.0).max_gradient
-            for window in windows
-        ]
+    def assertMaxGradientMonotonic(self, points: List[TrackPoint], windows: List[int]) -> None:
+        # Segments are cached on the Track, so per-window calls only redo the
+        # window pass and the sweep can stop at the first violation
+        track = Track.from_points(points)
+        gradients = {}
+        previous = math.inf
+        for window in windows:
+            gradients[window] = compute_statistics(track, smoothing_points=window, min_seg_m=2.0).max_gradient
+            self.assertLessEqual(
+                gradients[window],
+                previous,
+                f"Max gradient should not increase with larger smoothing windows, non-monotonic: {gradients}",
+            )
+            previous = gradients[window]
 
-        for earlier, later in zip(gradients, gradients[1:]):
-            self.assertLessEqual(later, earlier, "Max gradient should not increase with larger smoothing windows")
+    def test_max_gradient_monotonic_with_smoothing(self) -> None:
+        self.assertMaxGradientMonotonic(self._points_bobo, [0, 1, 10, 20, 30])
 
     def test_max_gradient_monotonic_for_cantonese_dataset(self) -> None:
-        data_path = (
-            Path(__file__).resolve().parents[1]
-            / "public"
-            / "data"
-            / "paths"
-            / "牛潭尾濾水廠-Out.csv"
-        )
-        points = read_paths_csv(os.fspath(data_path))
+        self.assertMaxGradientMonotonic(self._points_canto, [0, 1, 10, 20, 30, 50, 100])
 
-        windows = [0, 1, 10, 20, 30, 50, 100]
-        gradients = [
-            compute_statistics(points, smoothing_points=window, min_seg_m=2.0).max_gradient
-            for window in windows
-        ]
+    def test_max_gradient_monotonic_synthetic(self) -> None:
+        rng = random.Random(0)
+        base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        elevation = 100.0
+        points = []
+        # ~5 m steps east along a line with a noisy random-walk elevation profile.
+        for i in range(500):
+            elevation += rng.gauss(0.0, 1.0)
+            points.append(TrackPoint(22.0, 114.0 + i * 0.00005, elevation, base_time + timedelta(seconds=i)))
 
-        for earlier, later in zip(gradients, gradients[1:]):
-            self.assertLessEqual(later, earlier, "Max gradient should not increase with larger smoothing windows")
+        self.assertMaxGradientMonotonic(points, [0, 1, 10, 20, 30, 50, 100])
 
     def test_smoothing_reduces_total_ascent(self) -> None:
         base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -50,6 +76,167 @@ class ComputeStatisticsTests(unittest.TestCase):
 
         self.assertLess(smoothed_stats.total_ascent_m, raw_stats.total_ascent_m)
 
+    def test_many_windows_match_single_window_calls(self) -> None:
+        points = self._points_bobo
+
+        windows = [0, 1, 2, 10, 30]
+        self.assertEqual(
+            compute_statistics_many(points, windows, min_seg_m=2.0),
+            [compute_statistics(points, smoothing_points=window, min_seg_m=2.0) for window in windows],
+        )
+
+    def test_track_columns_match_point_list(self) -> None:
+        points = self._points_bobo
+        track = Track.from_points(points)
+
+        self.assertEqual(list(track), points)
+        self.assertEqual(list(track.reversed()), points[::-1])
+        self.assertEqual(
+            compute_statistics(track, smoothing_points=10, min_seg_m=2.0),
+            compute_statistics(points, smoothing_points=10, min_seg_m=2.0),
+        )
+
+
+class ParseIsoDatetimeTests(unittest.TestCase):
+    def test_accepts_iso_formats(self) -> None:
+        self.assertEqual(
+            parse_iso_datetime("2024-01-01T08:30:00.5Z"), datetime(2024, 1, 1, 8, 30, 0, 500000, tzinfo=timezone.utc)
+        )
+        self.assertEqual(parse_iso_datetime("2024-01-01T08:30:00"), datetime(2024, 1, 1, 8, 30))
+
+    def test_rejects_shapes_outside_iso_formats(self) -> None:
+        for value in ("2024-01-01", "2024-01-01 08:30:00", "2024-01-01T08:30", "2024-01-01T08:30:00+08"):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_iso_datetime(value)
+
+
+def _gpx_document(trkpts: str) -> str:
+    return (
+        '<?xml version="1.0"?>\n'
+        '<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1"><trk><trkseg>'
+        f"{trkpts}</trkseg></trk></gpx>"
+    )
+
+
+class ParseGpxTests(unittest.TestCase):
+    def test_text_split_across_read_buffers(self) -> None:
+        # Pad the document so the <ele> text straddles the parser's 16 KiB read chunks.
+        padding = " " * (16 * 1024 - 225)
+        gpx = _gpx_document(
+            f'<trkpt lat="22.1" lon="114.1"><ele>1.5</ele><time>2024-01-01T00:00:00Z</time></trkpt>{padding}'
+            '<trkpt lat="22.2" lon="114.2"><ele>123456.789012345</ele><time>2024-01-01T00:00:01Z</time></trkpt>'
+        )
+        split_at = gpx.encode("utf-8").index(b"123456.789012345")
+        self.assertLess(split_at, 16 * 1024)
+        self.assertGreater(split_at + len("123456.789012345"), 16 * 1024)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "track.gpx")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(gpx)
+            points = parse_gpx(path)
+
+        self.assertEqual([p.elevation for p in points], [1.5, 123456.789012345])
+        self.assertEqual(points[1].time, datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc))
+
+    def test_ignores_trkpt_outside_root_namespace(self) -> None:
+        gpx = _gpx_document(
+            '<trkpt lat="22.1" lon="114.1"><ele>1.5</ele><time>2024-01-01T00:00:00Z</time>'
+            '<extensions><x:trkpt xmlns:x="urn:example" lat="1" lon="1"><x:ele>9</x:ele></x:trkpt></extensions>'
+            "</trkpt>"
+            '<trkpt xmlns="http://www.topografix.com/GPX/1/0" lat="22.2" lon="114.2"><ele>2.5</ele></trkpt>'
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "track.gpx")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(gpx)
+            points = parse_gpx(path)
+
+        self.assertEqual([(p.latitude, p.elevation) for p in points], [(22.1, 1.5)])
+
+    def test_reparses_after_file_changes(self) -> None:
+        trkpt = '<trkpt lat="22.1" lon="114.1"><ele>{ele}</ele><time>2024-01-01T00:00:00Z</time></trkpt>'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "track.gpx")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(_gpx_document(trkpt.format(ele="1.5")))
+            first = parse_gpx(path)
+            self.assertEqual(parse_gpx(path), first)
+
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(_gpx_document(trkpt.format(ele="20.25")))
+            second = parse_gpx(path)
+
+        self.assertEqual([p.elevation for p in first], [1.5])
+        self.assertEqual([p.elevation for p in second], [20.25])
+
+
+class ReadPathsCsvTests(unittest.TestCase):
+    def _read(self, text: str) -> List[TrackPoint]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "paths.csv")
+            with open(path, "w", encoding="utf-8", newline="") as handle:
+                handle.write(text)
+            return read_paths_csv(path)
+
+    def assertReadError(self, text: str, message: str) -> None:
+        with self.assertRaises(ValueError) as ctx:
+            self._read(text)
+        self.assertEqual(str(ctx.exception), message)
+
+    def test_alias_headers_and_blank_lines(self) -> None:
+        points = self._read("latitude,longitude,elevation\n22.1,114.1,1.5\n\n22.2,114.2,2.5\n")
+
+        self.assertEqual(
+            [(p.latitude, p.longitude, p.elevation) for p in points], [(22.1, 114.1, 1.5), (22.2, 114.2, 2.5)]
+        )
+        self.assertEqual(points[1].time - points[0].time, timedelta(seconds=1))
+
+    def test_empty_value_falls_back_to_next_alias(self) -> None:
+        points = self._read("lat,latitude,lon,ele\n,22.1,114.1,1.5\n")
+
+        self.assertEqual([(p.latitude, p.longitude, p.elevation) for p in points], [(22.1, 114.1, 1.5)])
+
+    def test_missing_column(self) -> None:
+        self.assertReadError("lat,lng\n22.1,114.1\n", "Missing lat/lng/ele values on row 2")
+
+    def test_empty_value(self) -> None:
+        self.assertReadError("lat,lng,ele\n22.1,114.1,1.5\n22.2,,2.5\n", "Missing lat/lng/ele values on row 3")
+
+    def test_short_row(self) -> None:
+        self.assertReadError("lat,lng,ele\n22.1,114.1\n", "Missing lat/lng/ele values on row 2")
+
+    def test_non_numeric_value(self) -> None:
+        self.assertReadError(
+            "lat,lng,ele\n\n22.1,x,1.5\n",
+            "Invalid numeric value on row 2: could not convert string to float: 'x'",
+        )
+
+    def test_non_numeric_value_is_reported_before_missing_one(self) -> None:
+        self.assertReadError(
+            "lat,lng,ele\nabc,2,\n", "Invalid numeric value on row 2: could not convert string to float: 'abc'"
+        )
+
+    def test_header_only(self) -> None:
+        self.assertReadError("lat,lng,ele\n", "No path points found in the selected CSV file")
+
+    def test_empty_file(self) -> None:
+        self.assertReadError("", "Missing header row in paths.csv")
+
+    def test_rereads_after_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "paths.csv")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("lat,lng,ele\n22.1,114.1,1.5\n")
+            first = read_paths_csv(path)
+            self.assertEqual(read_paths_csv(path), first)
+
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("lat,lng,ele\n22.1,114.1,20.25\n")
+            second = read_paths_csv(path)
+
+        self.assertEqual([p.elevation for p in first], [1.5])
+        self.assertEqual([p.elevation for p in second], [20.25])
+
 
 if __name__ == "__main__":
     unittest.main()